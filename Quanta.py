@@ -13,13 +13,15 @@ import traceback
 import threading
 import multiprocessing
 import queue
-from typing import Optional, Dict
+import heapq
+from functools import lru_cache
+from typing import Callable, Optional, Dict
 import numpy as np
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
+from qiskit import QuantumCircuit, transpile
+from qiskit_aer import AerSimulator, AerError
 from qiskit.circuit import Parameter
 import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext, ttk
+from tkinter import filedialog, messagebox, scrolledtext, ttk, font as tkfont
 
 # Configure Logging
 logging.basicConfig(
@@ -29,25 +31,410 @@ logging.basicConfig(
     level=logging.INFO
 )
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _spin_kernel(p: float, shots: int, seed: int) -> float:
+        """
+        Fraction of shots that measure 1 for a qubit with probability p of measuring 1.
+        """
+        # Seeds numba's own RNG state, not NumPy's global one
+        np.random.seed(seed)
+        return (np.random.random(shots) < p).sum() / shots
+else:
+    def _spin_kernel(p: float, shots: int, seed: int) -> float:
+        """
+        Fraction of shots that measure 1 for a qubit with probability p of measuring 1.
+        """
+        rng = np.random.default_rng(seed)
+        return (rng.random(shots) < p).sum() / shots
+
+def _top_counts(counts: Dict[str, int], top_k: int = 16):
+    """
+    The top_k most frequent (outcome, count) pairs, without sorting all 2^n outcomes.
+    """
+    return heapq.nlargest(top_k, counts.items(), key=lambda item: item[1])
+
+
+def _summarize_counts(counts: Dict[str, int], top_k: int = 16) -> str:
+    top = ', '.join(f"{outcome}: {count}" for outcome, count in _top_counts(counts, top_k))
+    return f"{len(counts)} outcomes, top {min(top_k, len(counts))}: {top}"
+
+# Up to this many qubits the uniform H-then-measure distribution is sampled directly
+ANALYTIC_OBSERVE_MAX_QUBITS = 20
+
+# Rotation angles are cached on a grid of 2π/65536 steps over one full RX/RY/RZ period (4π)
+ANGLE_STEP = 2 * np.pi / 65536
+ANGLE_PERIOD_STEPS = 2 * 65536
+
+
+def _quantize_angle(angle: float) -> int:
+    """
+    Grid index of angle, so nearby and periodic-equivalent angles share a cache entry.
+    """
+    return int(round(angle / ANGLE_STEP)) % ANGLE_PERIOD_STEPS
+
+# Below this many qubits GPU launch overhead outweighs the faster kernels
+GPU_QUBIT_THRESHOLD = 16
+
+def _make_backend(precision: str = 'single', device: str = 'CPU') -> AerSimulator:
+    options = dict(
+        method='statevector',
+        precision=precision,
+        fusion_enable=True,
+        fusion_threshold=5,
+        fusion_max_qubit=5,
+        fusion_verbose=False,
+        max_parallel_threads=os.cpu_count() or 0
+    )
+    if device == 'GPU':
+        options.update(device='GPU', cuStateVec_enable=True, batched_shots_gpu=True)
+    return AerSimulator(**options)
+
+
+# --- Simulation Worker ---
+# Everything below runs inside QuantumCalculator's worker process, so Aer execution
+# (and any CUDA context a GPU simulator creates) never touches the Tk process.
+@lru_cache(maxsize=None)
+def _worker_gpu_available() -> bool:
+    try:
+        available = 'GPU' in AerSimulator().available_devices()
+    except AerError as e:
+        logging.info(f"GPU AerSimulator unavailable, using CPU only: {e}")
+        return False
+    if available:
+        logging.info("GPU AerSimulator available (cuStateVec).")
+    return available
+
+
+@lru_cache(maxsize=None)
+def _worker_backend(device: str, precision: str) -> AerSimulator:
+    return _make_backend(precision, device)
+
+
+def _worker_run(circuits, shots: int, precision: str):
+    """
+    Run circuits as one batch. Returns a (counts, statevector) pair per circuit;
+    statevector is None unless the circuit saves one.
+    """
+    # Route large circuits to the GPU simulator when one is available
+    num_qubits = max(circuit.num_qubits for circuit in circuits)
+    device = 'GPU' if num_qubits >= GPU_QUBIT_THRESHOLD and _worker_gpu_available() else 'CPU'
+    backend = _worker_backend(device, precision)
+    result = backend.run(circuits, shots=shots, memory=False, meas_level=2).result()
+    outputs = []
+    for i in range(len(circuits)):
+        data = result.data(i)
+        statevector = np.asarray(data['statevector']) if 'statevector' in data else None
+        outputs.append((result.get_counts(i), statevector))
+    return outputs
+
+
+def _sample_uniform_counts(num_qubits: int, shots: int) -> Dict[str, int]:
+    """
+    H on every qubit then measure gives a uniform distribution over all 2^n
+    bitstrings, so draw the counts from that multinomial directly.
+    """
+    n = 1 << num_qubits
+    draws = np.random.multinomial(shots, np.full(n, 1.0 / n))
+    spec = f'0{num_qubits}b'
+    return {format(i, spec): int(draws[i]) for i in np.nonzero(draws)[0]}
+
+
+def _worker_warmup(precision: str):
+    """
+    Import Aer, build the CPU backend and spin up its thread pool with a tiny run.
+    """
+    circuit = QuantumCircuit(2, 2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.measure([0, 1], [0, 1])
+    _worker_run([circuit], 1, precision)
+
+
+def _worker_grover(target_state: str, num_qubits: int, precision: str):
+    """
+    Run Grover's search for target_state. Returns (iterations, top_measurement).
+    """
+    try:
+        from qiskit_algorithms import AmplificationProblem, Grover
+        from qiskit_aer.primitives import SamplerV2
+        from qiskit.transpiler import generate_preset_pass_manager
+    except ImportError:
+        raise ImportError("Grover's algorithm module not found. Install it using 'pip install qiskit-algorithms'.")
+
+    # Phase oracle for |target_state>: flip the 0 bits to 1, apply a multi-controlled Z
+    # (H-MCX-H on the last qubit), then undo the flips. Bitstrings are little-endian,
+    # so qubit i is target_state[-1 - i].
+    mask = np.frombuffer(target_state[::-1].encode(), dtype=np.uint8) == ord('0')
+    zero_positions = np.where(mask)[0].tolist()
+    oracle = QuantumCircuit(num_qubits)
+    if zero_positions:
+        oracle.x(zero_positions)
+    if num_qubits == 1:
+        oracle.z(0)
+    else:
+        oracle.h(num_qubits - 1)
+        oracle.mcx(list(range(num_qubits - 1)), num_qubits - 1)
+        oracle.h(num_qubits - 1)
+    if zero_positions:
+        oracle.x(zero_positions)
+
+    problem = AmplificationProblem(oracle, is_good_state=[target_state])
+    iterations = Grover.optimal_num_iterations(num_solutions=1, num_qubits=num_qubits)
+    grover = Grover(
+        iterations=iterations,
+        sampler=SamplerV2(options={'backend_options': {'precision': precision}}),
+        transpiler=generate_preset_pass_manager(optimization_level=1, backend=_worker_backend('CPU', precision))
+    )
+    result = grover.amplify(problem)
+    return iterations, result.top_measurement
+
+
 # --- Quantum Calculator Functionalities ---
 class QuantumCalculator:
-    def __init__(self):
-        self.backend = AerSimulator(method='statevector')
-        logging.info("QuantumCalculator initialized with AerSimulator (statevector).")
+    def __init__(self, precision: str = 'single'):
+        self.precision = precision
+        # Transpilation target only; simulations run in the worker process below
+        self.backend = _make_backend(precision)
+        # A spawned (not forked) worker keeps Aer's threads and any GPU context out of this process
+        self._pool = multiprocessing.get_context('spawn').Pool(processes=1)
+        logging.info(f"QuantumCalculator initialized with AerSimulator (statevector, {precision} precision).")
+        # Shared angle parameter for the RX/RY/RZ gate templates
+        self._param = Parameter('θ')
+        # Per-instance circuit caches rather than one class-level cache keyed on self
+        self._build_observe_circuit = lru_cache(maxsize=128)(self._build_observe_circuit_uncached)
+        self._cached_template = lru_cache(maxsize=128)(self._cached_template_uncached)
+        self._build_gate_circuit = lru_cache(maxsize=128)(self._build_gate_circuit_uncached)
+        # Set once the first-call costs (worker start, transpiler, JIT) have been paid
+        self._ready = threading.Event()
+        # Pending (circuit, shots, callback) jobs, coalesced into batched backend runs
+        self.job_queue = queue.Queue()
+        threading.Thread(target=self._process_job_queue, daemon=True).start()
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        try:
+            _spin_kernel(0.5, 1, 0)
+            self._build_gate_circuit('RX', 0, 0)
+            self._pool.apply(_worker_warmup, (self.precision,))
+            logging.info("QuantumCalculator warmup complete.")
+        except Exception as e:
+            logging.error(f"Error in warmup: {e}")
+        finally:
+            self._ready.set()
+
+    def wait_ready(self, timeout: float = 5.0) -> bool:
+        """
+        Block until warmup has finished, or timeout seconds have passed.
+        """
+        return self._ready.wait(timeout=timeout)
+
+    def close(self):
+        """
+        Stop the batching thread and the simulation worker process. Must be called
+        when the calculator is no longer needed: the batching thread keeps it alive
+        until then.
+        """
+        self.job_queue.put(None)
+        self._pool.terminate()
+        self._pool.join()
+
+    def set_precision(self, precision: str):
+        """
+        Switch the simulator between 'single' and 'double' floating point precision.
+        """
+        if precision not in ('single', 'double'):
+            raise ValueError("Precision must be 'single' or 'double'.")
+        self.precision = precision
+        logging.info(f"Simulator precision set to {precision}.")
+
+    def _run_async(self, func: Callable, args: tuple, callback: Callable):
+        """
+        Run func(*args) in the worker process; callback receives (value, error) on a
+        pool thread.
+        """
+        self._pool.apply_async(
+            func, args,
+            callback=lambda value: callback(value, None),
+            error_callback=lambda error: callback(None, error)
+        )
+
+    @staticmethod
+    def _wait_for(submit: Callable, *args):
+        """
+        Call an asynchronous submit_* method and block until its callback fires,
+        returning the value or raising the error it reported.
+        """
+        finished = threading.Event()
+        outcome = {}
+        def callback(value, error):
+            outcome['value'], outcome['error'] = value, error
+            finished.set()
+        submit(*args, callback)
+        finished.wait()
+        if outcome['error'] is not None:
+            raise outcome['error']
+        return outcome['value']
+
+    def _build_observe_circuit_uncached(self, num_qubits: int) -> QuantumCircuit:
+        """
+        Hadamard-then-measure circuit, transpiled once per qubit count.
+        """
+        circuit = QuantumCircuit(num_qubits, num_qubits)
+        circuit.h(range(num_qubits))
+        circuit.measure(range(num_qubits), range(num_qubits))
+        return transpile(circuit, self.backend)
+
+    def _cached_template_uncached(self, gate_type: str, qubit: int) -> QuantumCircuit:
+        """
+        Transpiled single-gate circuit. RX/RY/RZ keep their angle as self._param
+        so one template serves every angle.
+        """
+        circuit = QuantumCircuit(qubit + 1)
+        if gate_type in ('RX', 'RY', 'RZ'):
+            getattr(circuit, gate_type.lower())(self._param, qubit)
+        elif gate_type == 'H':
+            circuit.h(qubit)
+        elif gate_type == 'X':
+            circuit.x(qubit)
+        else:
+            raise ValueError("Unsupported gate type.")
+        circuit.save_statevector()
+        return transpile(circuit, self.backend)
+
+    def _build_gate_circuit_uncached(self, gate_type: str, angle_step: int, qubit: int) -> QuantumCircuit:
+        """
+        Template from _cached_template with the angle for grid index angle_step bound in.
+        """
+        template = self._cached_template(gate_type, qubit)
+        if not template.parameters:
+            return template
+        return template.assign_parameters({self._param: angle_step * ANGLE_STEP}, inplace=False)
+
+    def submit(self, circuit: QuantumCircuit, shots: int, callback: Callable):
+        """
+        Queue a circuit for the next batched run. The callback is invoked from a
+        pool thread as callback((counts, statevector), error).
+        """
+        self.job_queue.put((circuit, shots, callback))
+
+    def _process_job_queue(self):
+        self.wait_ready()
+        while True:
+            job = self.job_queue.get()
+            if job is None:
+                return
+            batch = [job]
+            # Gather whatever else arrives shortly after so it shares one run
+            try:
+                while True:
+                    job = self.job_queue.get(timeout=0.02)
+                    if job is None:
+                        return
+                    batch.append(job)
+            except queue.Empty:
+                pass
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                # Grouping failed before anything was dispatched; fail the whole batch
+                logging.error(f"Error in batched run: {e}")
+                for _, _, callback in batch:
+                    callback(None, e)
+
+    def _run_batch(self, batch):
+        # Keep GPU-sized circuits apart so they do not drag small ones onto the GPU
+        groups = {}
+        for job in batch:
+            key = (job[1], job[0].num_qubits >= GPU_QUBIT_THRESHOLD)
+            groups.setdefault(key, []).append(job)
+        for (shots, _), jobs in groups.items():
+            circuits = [circuit for circuit, _, _ in jobs]
+            done = self._batch_done(jobs, shots)
+            try:
+                self._run_async(_worker_run, (circuits, shots, self.precision), done)
+            except Exception as e:
+                # Fail only this group so the others already dispatched are not reported twice
+                done(None, e)
+
+    @staticmethod
+    def _batch_done(jobs, shots: int) -> Callable:
+        def done(outputs, error):
+            if error is not None:
+                logging.error(f"Error in batched run: {error}")
+                for _, _, callback in jobs:
+                    callback(None, error)
+                return
+            logging.info(f"Ran batch of {len(jobs)} circuit(s) with {shots} shots.")
+            for (_, _, callback), output in zip(jobs, outputs):
+                callback(output, None)
+        return done
+
+    def _submit_observe_circuit(self, num_qubits: int, shots: int, callback: Callable):
+        if num_qubits <= ANALYTIC_OBSERVE_MAX_QUBITS:
+            # Sampling and formatting 2^n outcomes is too slow for the Tk thread
+            self._run_async(_sample_uniform_counts, (num_qubits, shots), callback)
+        else:
+            self.submit(
+                self._build_observe_circuit(num_qubits), shots,
+                lambda output, error: callback(output[0] if error is None else None, error)
+            )
+
+    def submit_observe(self, num_qubits: int, shots: int, callback: Callable):
+        """
+        Asynchronous observe_qubits; callback receives (counts, error).
+        """
+        def done(counts, error):
+            if error is None:
+                logging.info(f"Observed qubits: {_summarize_counts(counts)}")
+            callback(counts, error)
+        self._submit_observe_circuit(num_qubits, shots, done)
+
+    def submit_error_rate(self, num_qubits: int, shots: int, callback: Callable):
+        """
+        Asynchronous calculate_error_rates and calculate_bit_error_rates on the same
+        shots; callback receives ((error_rate, bit_error_rate), error).
+        """
+        def done(counts, error):
+            if error is not None:
+                callback(None, error)
+                return
+            error_rate = self._error_rate_from_counts(counts, num_qubits)
+            bit_error_rate = self._bit_error_rate_from_counts(counts, num_qubits)
+            logging.info(f"Calculated error rate: {error_rate}, bit error rate: {bit_error_rate}")
+            callback((error_rate, bit_error_rate), None)
+        self._submit_observe_circuit(num_qubits, shots, done)
+
+    @staticmethod
+    def _error_rate_from_counts(counts: Dict[str, int], num_qubits: int) -> float:
+        # Every outcome other than the all-zero bitstring contains a '1'
+        total = sum(counts.values())
+        return (total - counts.get('0' * num_qubits, 0)) / total
+
+    @staticmethod
+    def _bit_error_rate_from_counts(counts: Dict[str, int], num_qubits: int) -> float:
+        # Hamming weight of each outcome via int.bit_count (a single popcount)
+        total = sum(counts.values())
+        flipped = sum(int(outcome, 2).bit_count() * count for outcome, count in counts.items())
+        return flipped / (num_qubits * total)
 
     def observe_qubits(self, num_qubits: int, shots: int = 1024) -> Dict[str, int]:
         """
         Example method to measure qubits after applying Hadamard gates.
         """
         try:
-            circuit = QuantumCircuit(num_qubits, num_qubits)
-            circuit.h(range(num_qubits))
-            circuit.measure(range(num_qubits), range(num_qubits))
-            circuit.save_statevector()
-            job = self.backend.run(circuit, shots=shots)
-            result = job.result()
-            counts = result.get_counts(circuit)
-            logging.info(f"Observed qubits: {counts}")
+            if num_qubits <= ANALYTIC_OBSERVE_MAX_QUBITS:
+                counts = _sample_uniform_counts(num_qubits, shots)
+            else:
+                circuit = self._build_observe_circuit(num_qubits)
+                counts, _ = self._pool.apply(_worker_run, ([circuit], shots, self.precision))[0]
+            logging.info(f"Observed qubits: {_summarize_counts(counts)}")
             return counts
         except Exception as e:
             logging.error(f"Error in observe_qubits: {e}")
@@ -56,64 +443,103 @@ class QuantumCalculator:
     def calculate_error_rates(self, num_qubits: int, shots: int = 1024) -> float:
         """
         Very rough example of "error rate" by counting how many outcomes have '1' in them.
+        Every outcome other than the all-zero bitstring contains a '1', so this is
+        simply the shots that did not land on |00...0>.
         """
         try:
             counts = self.observe_qubits(num_qubits, shots)
-            total = sum(counts.values())
-            errors = 0
-            for outcome, count in counts.items():
-                if '1' in outcome:
-                    errors += count
-            error_rate = errors / total
+            error_rate = self._error_rate_from_counts(counts, num_qubits)
             logging.info(f"Calculated error rate: {error_rate}")
             return error_rate
         except Exception as e:
             logging.error(f"Error in calculate_error_rates: {e}")
             raise
 
+    def calculate_bit_error_rates(self, num_qubits: int, shots: int = 1024) -> float:
+        """
+        Fraction of measured bits that read '1', i.e. Hamming weight per outcome
+        averaged over all qubits and shots.
+        """
+        try:
+            counts = self.observe_qubits(num_qubits, shots)
+            bit_error_rate = self._bit_error_rate_from_counts(counts, num_qubits)
+            logging.info(f"Calculated bit error rate: {bit_error_rate}")
+            return bit_error_rate
+        except Exception as e:
+            logging.error(f"Error in calculate_bit_error_rates: {e}")
+            raise
+
     def calculate_gate_variables(self, gate_type: str, angle: float = 0.0, qubit: int = 0) -> QuantumCircuit:
         """
         Builds a simple circuit applying a single gate to a given qubit.
         """
         try:
-            circuit = QuantumCircuit(qubit + 1)
-            if gate_type.upper() == 'RX':
-                circuit.rx(angle, qubit)
-            elif gate_type.upper() == 'RY':
-                circuit.ry(angle, qubit)
-            elif gate_type.upper() == 'RZ':
-                circuit.rz(angle, qubit)
-            elif gate_type.upper() == 'H':
-                circuit.h(qubit)
-            elif gate_type.upper() == 'X':
-                circuit.x(qubit)
-            else:
-                raise ValueError("Unsupported gate type.")
-            circuit.save_statevector()
+            gate_type = gate_type.upper()
+            # Parameterless gates ignore the angle, so keep them on a single cache entry
+            angle_step = _quantize_angle(angle) if gate_type in ('RX', 'RY', 'RZ') else 0
+            # Copy so callers cannot mutate the cached circuit
+            circuit = self._build_gate_circuit(gate_type, angle_step, qubit).copy()
             logging.info(f"Applied gate {gate_type} with angle {angle} on qubit {qubit}.")
             return circuit
         except Exception as e:
             logging.error(f"Error in calculate_gate_variables: {e}")
             raise
 
+    def submit_gate(self, circuit: QuantumCircuit, callback: Callable):
+        """
+        Run a circuit from calculate_gate_variables in the worker process; callback
+        receives ((counts, statevector), error).
+        """
+        # The statevector is deterministic, so a single shot is enough
+        self.submit(circuit, 1, callback)
+
+    def _sweep_circuits(self, gate_type: str, angles: np.ndarray, qubit: int):
+        gate_type = gate_type.upper()
+        if gate_type not in ('RX', 'RY', 'RZ'):
+            raise ValueError("Only RX, RY and RZ gates can be swept.")
+        template = self._cached_template(gate_type, qubit)
+        return [template.assign_parameters({self._param: angle}, inplace=False) for angle in angles]
+
+    @staticmethod
+    def _sweep_error_rates(outputs) -> np.ndarray:
+        # Probability of any '1' outcome is everything outside |00...0>
+        return np.array([1.0 - abs(statevector[0]) ** 2 for _, statevector in outputs])
+
+    def calculate_gate_variables_sweep(self, gate_type: str, angles: np.ndarray, qubit: int = 0) -> np.ndarray:
+        """
+        Sweep an RX/RY/RZ gate over many angles in one batched run. Returns the
+        error rate (probability of any '1' outcome) for each angle.
+        """
+        return self._wait_for(self.submit_sweep, gate_type, angles, qubit)
+
+    def submit_sweep(self, gate_type: str, angles: np.ndarray, qubit: int, callback: Callable):
+        """
+        Asynchronous calculate_gate_variables_sweep; callback receives (error_rates, error).
+        """
+        try:
+            circuits = self._sweep_circuits(gate_type, angles, qubit)
+        except Exception as e:
+            logging.error(f"Error in calculate_gate_variables_sweep: {e}")
+            raise
+        def done(outputs, error):
+            if error is not None:
+                logging.error(f"Error in calculate_gate_variables_sweep: {error}")
+                callback(None, error)
+                return
+            logging.info(f"Swept gate {gate_type} over {len(circuits)} angles on qubit {qubit}.")
+            callback(self._sweep_error_rates(outputs), None)
+        # Statevectors are deterministic, so a single shot per circuit is enough
+        self._run_async(_worker_run, (circuits, 1, self.precision), done)
+
     def calculate_spin(self, qubit_state: Optional[str] = None) -> float:
         """
         Demonstration method for spin measurement. 
         Here we measure in the X-basis after optionally preparing the qubit.
+        H|0> and H|1> both give p(1) = 0.5, so the 1024 shots are sampled directly
+        instead of simulating the circuit.
         """
         try:
-            circuit = QuantumCircuit(1, 1)
-            if qubit_state == '1':
-                circuit.x(0)
-            # measure in the X-basis using H and then measure in the Z-basis
-            circuit.h(0)
-            circuit.measure(0, 0)
-            circuit.save_statevector()
-            job = self.backend.run(circuit, shots=1024)
-            result = job.result()
-            counts = result.get_counts(circuit)
-            ones = counts.get('1', 0)
-            spin = ones / 1024
+            spin = _spin_kernel(0.5, 1024, np.random.randint(2**31 - 1))
             logging.info(f"Calculated spin: {spin}")
             return spin
         except Exception as e:
@@ -124,36 +550,28 @@ class QuantumCalculator:
         """
         Demonstration placeholder for Grover's speed calculation or iteration count.
         """
-        try:
-            from qiskit.algorithms import Grover
-            from qiskit.circuit.library import ZGate
-
-            if len(target_state) != num_qubits:
-                raise ValueError("Target state length must match the number of qubits.")
-
-            oracle = QuantumCircuit(num_qubits)
-            # Very simple placeholder oracle
-            for idx, bit in enumerate(target_state):
-                if bit == '0':
-                    oracle.x(idx)
-            oracle.cz(num_qubits - 1, num_qubits - 2)  # Example: a CZ gate
-            for idx, bit in enumerate(target_state):
-                if bit == '0':
-                    oracle.x(idx)
-            oracle.save_statevector()
-
-            grover = Grover(oracle=oracle)
-            result = grover.run(self.backend)
-            iterations = result.optimal_num_iterations
+        return self._wait_for(self.submit_grover, target_state, num_qubits)
+
+    def submit_grover(self, target_state: str, num_qubits: int, callback: Callable):
+        """
+        Asynchronous grovers_speed_between_qubits; callback receives (speed, error).
+        """
+        if len(target_state) != num_qubits:
+            logging.error("Error in grovers_speed_between_qubits: Target state length must match the number of qubits.")
+            raise ValueError("Target state length must match the number of qubits.")
+        def done(value, error):
+            if isinstance(error, ImportError):
+                logging.error(f"Grover's algorithm module not found: {error}")
+            elif error is not None:
+                logging.error(f"Error in grovers_speed_between_qubits: {error}")
+            if error is not None:
+                callback(None, error)
+                return
+            iterations, top_measurement = value
             speed = iterations  # Placeholder metric
-            logging.info(f"Grover's algorithm iterations: {iterations}")
-            return speed
-        except ImportError:
-            logging.error("Grover's algorithm module not found. Please ensure you have the latest version of Qiskit installed.")
-            raise ImportError("Grover's algorithm module not found. Please update Qiskit using 'pip install --upgrade qiskit'.")
-        except Exception as e:
-            logging.error(f"Error in grovers_speed_between_qubits: {e}")
-            raise
+            logging.info(f"Grover's algorithm iterations: {iterations}, top measurement: {top_measurement}")
+            callback(speed, None)
+        self._run_async(_worker_grover, (target_state, num_qubits, self.precision), done)
 
     # --------------------------------------------------------------------------
     # NEW: QELM / Quantum LLM Tools
@@ -190,45 +608,73 @@ class QuantumVerseCalculatorGUI:
         master.geometry("900x700")  # Increased size for better layout
         master.resizable(False, False)
         self.calculator = QuantumCalculator()
+        self._style = ttk.Style(master)
+        # Named fonts: every widget and style using them follows a single configure() call
+        self._app_font = tkfont.Font(master, family="Helvetica", size=10)
+        self._app_font_bold = tkfont.Font(master, family="Helvetica", size=10, weight="bold")
+        self._result_font = tkfont.Font(master, family="Helvetica", size=12, weight="bold")
+        self._themes = self.build_themes()
+        self._current_theme = None
+        # Pending after() id for a debounced font resize
+        self._font_after = None
         self.create_widgets()
         self.log_queue = queue.Queue()
+        self.log_idle_cycles = 0
+        # Finished calculator jobs waiting to be handled on the Tk thread
+        self.result_queue = queue.Queue()
         self.master.after(100, self.process_log_queue)
+        self.master.after(50, self.process_result_queue)
+
+    def build_themes(self) -> Dict[str, dict]:
+        """
+        Precomputed style settings per theme: window/log colors plus
+        {style_name: (configure_kwargs, map_kwargs)} for ttk.
+        """
+        def styles(background, field_background):
+            return {
+                "TButton": (dict(background="#4A90E2", foreground="black", font=self._app_font_bold),
+                            dict(background=[('active', '#357ABD')])),
+                "TLabel": (dict(background=background, foreground="black", font=self._app_font), None),
+                "TFrame": (dict(background=background), None),
+                "TEntry": (dict(fieldbackground=field_background, foreground="black"), None),
+                "TCombobox": (dict(fieldbackground=field_background, foreground="black"), None),
+                "TNotebook": (dict(background=background), None),
+                "TNotebook.Tab": (dict(background="#4A90E2", foreground="black", font=self._app_font_bold),
+                                  dict(background=[('selected', '#357ABD')], foreground=[('selected', 'black')])),
+            }
+        return {
+            "Dark": {"window_bg": "#2C3E50", "log_bg": "#34495E", "styles": styles("#2C3E50", "#34495E")},
+            "Light": {"window_bg": "#ECF0F1", "log_bg": "#ffffff", "styles": styles("#ECF0F1", "#ffffff")},
+        }
+
+    def apply_theme(self, theme: str):
+        """
+        Apply a theme from self._themes, touching only the styles that differ from
+        the current theme.
+        """
+        if theme == self._current_theme:
+            return
+        current = self._themes[self._current_theme]["styles"] if self._current_theme else {}
+        for name, (cfg, mp) in self._themes[theme]["styles"].items():
+            if current.get(name) == (cfg, mp):
+                continue
+            self._style.configure(name, **cfg)
+            if mp:
+                self._style.map(name, **mp)
+        self._current_theme = theme
 
     def create_widgets(self):
-        style = ttk.Style()
+        style = self._style
         # Use a more modern font
-        default_font = ("Helvetica", 10)
-        style.configure(".", font=default_font)
+        style.configure(".", font=self._app_font)
+        # Combobox drop-down lists are plain Tk listboxes, styled through the option database
+        self.master.option_add("*TCombobox*Listbox.font", self._app_font)
 
         # Configure styles with black text
         style.configure("TButton",
                         padding=6,
-                        relief="flat",
-                        background="#4A90E2",
-                        foreground="black",
-                        font=("Helvetica", 10, "bold"))
-        style.map("TButton",
-                  background=[('active', '#357ABD')])
-
-        style.configure("TLabel",
-                        background="#2C3E50",
-                        foreground="black",
-                        font=("Helvetica", 10))
-        style.configure("TFrame",
-                        background="#2C3E50")
-        style.configure("TEntry",
-                        fieldbackground="#34495E",
-                        foreground="black",
-                        font=("Helvetica", 10))
-        style.configure("TCombobox",
-                        fieldbackground="#34495E",
-                        foreground="black",
-                        font=("Helvetica", 10))
-        style.configure("TNotebook", background="#2C3E50")
-        style.configure("TNotebook.Tab", background="#4A90E2", foreground="black", font=("Helvetica", 10, "bold"))
-        style.map("TNotebook.Tab",
-                  background=[('selected', '#357ABD')],
-                  foreground=[('selected', 'black')])
+                        relief="flat")
+        self.apply_theme("Dark")
 
         container = ttk.Frame(self.master, padding=10)
         container.pack(fill='both', expand=True)
@@ -262,6 +708,11 @@ class QuantumVerseCalculatorGUI:
         self.notebook.add(self.tab_grover, text="Grover's Speed")
         self.create_grover_tab()
 
+        # Gate Sweep Tab
+        self.tab_sweep = ttk.Frame(self.notebook)
+        self.notebook.add(self.tab_sweep, text="Sweep")
+        self.create_sweep_tab()
+
         # ------------------------------------------------------------------
         # NEW TAB: QELM Tools (Quantum LLM calculations)
         # ------------------------------------------------------------------
@@ -279,7 +730,7 @@ class QuantumVerseCalculatorGUI:
         self.log_frame.pack(fill='both', expand=True, pady=10)
         self.log_text = scrolledtext.ScrolledText(
             self.log_frame, state='disabled', wrap='word',
-            bg="#34495E", fg="black", font=("Helvetica", 10)
+            bg="#34495E", fg="black", font=self._app_font
         )
         self.log_text.pack(fill='both', expand=True, padx=5, pady=5)
 
@@ -291,12 +742,12 @@ class QuantumVerseCalculatorGUI:
         frame.pack(fill='both', expand=True)
 
         ttk.Label(frame, text="Number of Qubits:").grid(row=0, column=0, padx=10, pady=10, sticky='e')
-        self.observe_qubits_entry = ttk.Entry(frame, width=15)
+        self.observe_qubits_entry = ttk.Entry(frame, width=15, font=self._app_font)
         self.observe_qubits_entry.insert(0, "2")
         self.observe_qubits_entry.grid(row=0, column=1, padx=10, pady=10, sticky='w')
 
         ttk.Label(frame, text="Shots:").grid(row=1, column=0, padx=10, pady=10, sticky='e')
-        self.observe_shots_entry = ttk.Entry(frame, width=15)
+        self.observe_shots_entry = ttk.Entry(frame, width=15, font=self._app_font)
         self.observe_shots_entry.insert(0, "1024")
         self.observe_shots_entry.grid(row=1, column=1, padx=10, pady=10, sticky='w')
 
@@ -304,7 +755,7 @@ class QuantumVerseCalculatorGUI:
         observe_button.grid(row=2, column=0, columnspan=2, pady=20)
 
         self.observe_result = scrolledtext.ScrolledText(
-            frame, height=10, state='disabled', bg="#34495E", fg="black", font=("Helvetica", 10)
+            frame, height=10, state='disabled', bg="#34495E", fg="black", font=self._app_font
         )
         self.observe_result.grid(row=3, column=0, columnspan=2, padx=10, pady=10)
 
@@ -313,19 +764,19 @@ class QuantumVerseCalculatorGUI:
         frame.pack(fill='both', expand=True)
 
         ttk.Label(frame, text="Number of Qubits:").grid(row=0, column=0, padx=10, pady=10, sticky='e')
-        self.error_qubits_entry = ttk.Entry(frame, width=15)
+        self.error_qubits_entry = ttk.Entry(frame, width=15, font=self._app_font)
         self.error_qubits_entry.insert(0, "2")
         self.error_qubits_entry.grid(row=0, column=1, padx=10, pady=10, sticky='w')
 
         ttk.Label(frame, text="Shots:").grid(row=1, column=0, padx=10, pady=10, sticky='e')
-        self.error_shots_entry = ttk.Entry(frame, width=15)
+        self.error_shots_entry = ttk.Entry(frame, width=15, font=self._app_font)
         self.error_shots_entry.insert(0, "1024")
         self.error_shots_entry.grid(row=1, column=1, padx=10, pady=10, sticky='w')
 
         error_button = ttk.Button(frame, text="Calculate Error Rate", command=self.calculate_error_rate)
         error_button.grid(row=2, column=0, columnspan=2, pady=20)
 
-        self.error_result = ttk.Label(frame, text="Error Rate: N/A", font=("Helvetica", 12, "bold"))
+        self.error_result = ttk.Label(frame, text="Error Rate: N/A\nBit Error Rate: N/A", font=self._result_font)
         self.error_result.grid(row=3, column=0, columnspan=2, pady=10)
 
     def create_gates_tab(self):
@@ -334,18 +785,18 @@ class QuantumVerseCalculatorGUI:
 
         ttk.Label(frame, text="Gate Type:").grid(row=0, column=0, padx=10, pady=10, sticky='e')
         self.gate_type_var = tk.StringVar()
-        self.gate_type_combo = ttk.Combobox(frame, textvariable=self.gate_type_var, state='readonly', width=17)
+        self.gate_type_combo = ttk.Combobox(frame, textvariable=self.gate_type_var, state='readonly', width=17, font=self._app_font)
         self.gate_type_combo['values'] = ('RX', 'RY', 'RZ', 'H', 'X')
         self.gate_type_combo.current(0)
         self.gate_type_combo.grid(row=0, column=1, padx=10, pady=10, sticky='w')
 
         ttk.Label(frame, text="Angle (for RX, RY, RZ):").grid(row=1, column=0, padx=10, pady=10, sticky='e')
-        self.gate_angle_entry = ttk.Entry(frame, width=15)
+        self.gate_angle_entry = ttk.Entry(frame, width=15, font=self._app_font)
         self.gate_angle_entry.insert(0, "0.0")
         self.gate_angle_entry.grid(row=1, column=1, padx=10, pady=10, sticky='w')
 
         ttk.Label(frame, text="Qubit Index:").grid(row=2, column=0, padx=10, pady=10, sticky='e')
-        self.gate_qubit_entry = ttk.Entry(frame, width=15)
+        self.gate_qubit_entry = ttk.Entry(frame, width=15, font=self._app_font)
         self.gate_qubit_entry.insert(0, "0")
         self.gate_qubit_entry.grid(row=2, column=1, padx=10, pady=10, sticky='w')
 
@@ -353,7 +804,7 @@ class QuantumVerseCalculatorGUI:
         gate_button.grid(row=3, column=0, columnspan=2, pady=20)
 
         self.gate_result = scrolledtext.ScrolledText(
-            frame, height=10, state='disabled', bg="#34495E", fg="black", font=("Helvetica", 10)
+            frame, height=10, state='disabled', bg="#34495E", fg="black", font=self._app_font
         )
         self.gate_result.grid(row=4, column=0, columnspan=2, padx=10, pady=10)
 
@@ -363,7 +814,7 @@ class QuantumVerseCalculatorGUI:
 
         ttk.Label(frame, text="Qubit State:").grid(row=0, column=0, padx=10, pady=10, sticky='e')
         self.spin_state_var = tk.StringVar()
-        self.spin_state_combo = ttk.Combobox(frame, textvariable=self.spin_state_var, state='readonly', width=17)
+        self.spin_state_combo = ttk.Combobox(frame, textvariable=self.spin_state_var, state='readonly', width=17, font=self._app_font)
         self.spin_state_combo['values'] = ('0', '1')
         self.spin_state_combo.current(0)
         self.spin_state_combo.grid(row=0, column=1, padx=10, pady=10, sticky='w')
@@ -371,7 +822,7 @@ class QuantumVerseCalculatorGUI:
         spin_button = ttk.Button(frame, text="Calculate Spin", command=self.calculate_spin)
         spin_button.grid(row=1, column=0, columnspan=2, pady=20)
 
-        self.spin_result = ttk.Label(frame, text="Spin: N/A", font=("Helvetica", 12, "bold"))
+        self.spin_result = ttk.Label(frame, text="Spin: N/A", font=self._result_font)
         self.spin_result.grid(row=2, column=0, columnspan=2, pady=10)
 
     def create_grover_tab(self):
@@ -379,21 +830,60 @@ class QuantumVerseCalculatorGUI:
         frame.pack(fill='both', expand=True)
 
         ttk.Label(frame, text="Target State (binary):").grid(row=0, column=0, padx=10, pady=10, sticky='e')
-        self.grover_target_entry = ttk.Entry(frame, width=20)
+        self.grover_target_entry = ttk.Entry(frame, width=20, font=self._app_font)
         self.grover_target_entry.insert(0, "11")
         self.grover_target_entry.grid(row=0, column=1, padx=10, pady=10, sticky='w')
 
         ttk.Label(frame, text="Number of Qubits:").grid(row=1, column=0, padx=10, pady=10, sticky='e')
-        self.grover_qubits_entry = ttk.Entry(frame, width=20)
+        self.grover_qubits_entry = ttk.Entry(frame, width=20, font=self._app_font)
         self.grover_qubits_entry.insert(0, "2")
         self.grover_qubits_entry.grid(row=1, column=1, padx=10, pady=10, sticky='w')
 
         grover_button = ttk.Button(frame, text="Run Grover's Algorithm", command=self.run_grovers)
         grover_button.grid(row=2, column=0, columnspan=2, pady=20)
 
-        self.grover_result = ttk.Label(frame, text="Grover's Speed: N/A", font=("Helvetica", 12, "bold"))
+        self.grover_result = ttk.Label(frame, text="Grover's Speed: N/A", font=self._result_font)
         self.grover_result.grid(row=3, column=0, columnspan=2, pady=10)
 
+    def create_sweep_tab(self):
+        frame = ttk.Frame(self.tab_sweep, padding=20)
+        frame.pack(fill='both', expand=True)
+
+        ttk.Label(frame, text="Gate Type:").grid(row=0, column=0, padx=10, pady=5, sticky='e')
+        self.sweep_gate_var = tk.StringVar()
+        self.sweep_gate_combo = ttk.Combobox(frame, textvariable=self.sweep_gate_var, state='readonly', width=17, font=self._app_font)
+        self.sweep_gate_combo['values'] = ('RX', 'RY', 'RZ')
+        self.sweep_gate_combo.current(0)
+        self.sweep_gate_combo.grid(row=0, column=1, padx=10, pady=5, sticky='w')
+
+        ttk.Label(frame, text="Qubit Index:").grid(row=0, column=2, padx=10, pady=5, sticky='e')
+        self.sweep_qubit_entry = ttk.Entry(frame, width=15, font=self._app_font)
+        self.sweep_qubit_entry.insert(0, "0")
+        self.sweep_qubit_entry.grid(row=0, column=3, padx=10, pady=5, sticky='w')
+
+        ttk.Label(frame, text="Start Angle:").grid(row=1, column=0, padx=10, pady=5, sticky='e')
+        self.sweep_start_entry = ttk.Entry(frame, width=15, font=self._app_font)
+        self.sweep_start_entry.insert(0, "0.0")
+        self.sweep_start_entry.grid(row=1, column=1, padx=10, pady=5, sticky='w')
+
+        ttk.Label(frame, text="Stop Angle:").grid(row=1, column=2, padx=10, pady=5, sticky='e')
+        self.sweep_stop_entry = ttk.Entry(frame, width=15, font=self._app_font)
+        self.sweep_stop_entry.insert(0, "6.2832")
+        self.sweep_stop_entry.grid(row=1, column=3, padx=10, pady=5, sticky='w')
+
+        ttk.Label(frame, text="Steps:").grid(row=2, column=0, padx=10, pady=5, sticky='e')
+        self.sweep_steps_entry = ttk.Entry(frame, width=15, font=self._app_font)
+        self.sweep_steps_entry.insert(0, "50")
+        self.sweep_steps_entry.grid(row=2, column=1, padx=10, pady=5, sticky='w')
+
+        sweep_button = ttk.Button(frame, text="Run Sweep", command=self.run_sweep)
+        sweep_button.grid(row=3, column=0, columnspan=4, pady=10)
+
+        # The plot canvas is created on the first sweep so matplotlib stays optional
+        self.sweep_plot_frame = ttk.Frame(frame)
+        self.sweep_plot_frame.grid(row=4, column=0, columnspan=4, padx=10, pady=5)
+        self.sweep_canvas = None
+
     # ----------------------------------------------------------------------
     # NEW: QELM Tools Tab
     # ----------------------------------------------------------------------
@@ -403,19 +893,19 @@ class QuantumVerseCalculatorGUI:
 
         # embed_dim
         ttk.Label(frame, text="Embedding Dimension (embed_dim):").grid(row=0, column=0, padx=10, pady=10, sticky='e')
-        self.qelm_embed_entry = ttk.Entry(frame, width=15)
+        self.qelm_embed_entry = ttk.Entry(frame, width=15, font=self._app_font)
         self.qelm_embed_entry.insert(0, "64")
         self.qelm_embed_entry.grid(row=0, column=1, padx=10, pady=10, sticky='w')
 
         # num_heads
         ttk.Label(frame, text="Number of Attention Heads:").grid(row=1, column=0, padx=10, pady=10, sticky='e')
-        self.qelm_heads_entry = ttk.Entry(frame, width=15)
+        self.qelm_heads_entry = ttk.Entry(frame, width=15, font=self._app_font)
         self.qelm_heads_entry.insert(0, "4")
         self.qelm_heads_entry.grid(row=1, column=1, padx=10, pady=10, sticky='w')
 
         # circuit_depth
         ttk.Label(frame, text="Circuit Depth (approx):").grid(row=2, column=0, padx=10, pady=10, sticky='e')
-        self.qelm_depth_entry = ttk.Entry(frame, width=15)
+        self.qelm_depth_entry = ttk.Entry(frame, width=15, font=self._app_font)
         self.qelm_depth_entry.insert(0, "10")
         self.qelm_depth_entry.grid(row=2, column=1, padx=10, pady=10, sticky='w')
 
@@ -425,7 +915,7 @@ class QuantumVerseCalculatorGUI:
 
         # Results
         self.qelm_result = scrolledtext.ScrolledText(
-            frame, height=10, state='disabled', bg="#34495E", fg="black", font=("Helvetica", 10)
+            frame, height=10, state='disabled', bg="#34495E", fg="black", font=self._app_font
         )
         self.qelm_result.grid(row=4, column=0, columnspan=2, padx=10, pady=10)
 
@@ -439,21 +929,30 @@ class QuantumVerseCalculatorGUI:
         # Font Size Setting
         ttk.Label(frame, text="Font Size:").grid(row=0, column=0, padx=10, pady=10, sticky='e')
         self.font_size_var = tk.IntVar(value=10)
-        self.font_size_spinbox = ttk.Spinbox(frame, from_=8, to=20, textvariable=self.font_size_var, width=5, command=self.update_font_size)
+        self.font_size_spinbox = ttk.Spinbox(frame, from_=8, to=20, textvariable=self.font_size_var, width=5, font=self._app_font, command=self._schedule_font)
         self.font_size_spinbox.grid(row=0, column=1, padx=10, pady=10, sticky='w')
 
         # Theme Selection
         ttk.Label(frame, text="Theme:").grid(row=1, column=0, padx=10, pady=10, sticky='e')
         self.theme_var = tk.StringVar(value="Dark")
-        self.theme_combo = ttk.Combobox(frame, textvariable=self.theme_var, state='readonly', width=17)
+        self.theme_combo = ttk.Combobox(frame, textvariable=self.theme_var, state='readonly', width=17, font=self._app_font)
         self.theme_combo['values'] = ('Dark', 'Light')
         self.theme_combo.current(0)
         self.theme_combo.grid(row=1, column=1, padx=10, pady=10, sticky='w')
         self.theme_combo.bind("<<ComboboxSelected>>", self.change_theme)
 
+        # Simulator Precision
+        ttk.Label(frame, text="Simulator Precision:").grid(row=2, column=0, padx=10, pady=10, sticky='e')
+        self.precision_var = tk.StringVar(value="single")
+        self.precision_combo = ttk.Combobox(frame, textvariable=self.precision_var, state='readonly', width=17, font=self._app_font)
+        self.precision_combo['values'] = ('single', 'double')
+        self.precision_combo.current(0)
+        self.precision_combo.grid(row=2, column=1, padx=10, pady=10, sticky='w')
+        self.precision_combo.bind("<<ComboboxSelected>>", self.change_precision)
+
         # Apply Button
         apply_button = ttk.Button(frame, text="Apply Settings", command=self.apply_settings)
-        apply_button.grid(row=2, column=0, columnspan=2, pady=20)
+        apply_button.grid(row=3, column=0, columnspan=2, pady=20)
 
     # ----------------------------------------------------------------------
     # QELM Tools Calculation Function
@@ -489,75 +988,37 @@ class QuantumVerseCalculatorGUI:
     # ----------------------------------------------------------------------
     # The rest of the UI callbacks
     # ----------------------------------------------------------------------
+    def _schedule_font(self):
+        # Holding a spinbox arrow fires many commands; resize once it settles
+        if self._font_after:
+            self.master.after_cancel(self._font_after)
+        self._font_after = self.master.after(150, self.update_font_size)
+
     def update_font_size(self):
+        if self._font_after:
+            self.master.after_cancel(self._font_after)
+            self._font_after = None
         new_size = self.font_size_var.get()
-        default_font = ("Helvetica", new_size)
-        for widget in self.master.winfo_children():
-            try:
-                widget.configure(font=default_font)
-            except:
-                pass
+        self._app_font.configure(size=new_size)
+        self._app_font_bold.configure(size=new_size)
+        self._result_font.configure(size=new_size + 2)
 
     def change_theme(self, event):
-        theme = self.theme_var.get()
-        if theme == "Light":
-            self.master.configure(bg="#ECF0F1")
-            style = ttk.Style()
-            style.configure("TButton",
-                            background="#4A90E2",
-                            foreground="black",
-                            font=("Helvetica", 10, "bold"))
-            style.map("TButton",
-                      background=[('active', '#357ABD')])
-            style.configure("TLabel",
-                            background="#ECF0F1",
-                            foreground="black",
-                            font=("Helvetica", 10))
-            style.configure("TFrame",
-                            background="#ECF0F1")
-            style.configure("TEntry",
-                            fieldbackground="#ffffff",
-                            foreground="black",
-                            font=("Helvetica", 10))
-            style.configure("TCombobox",
-                            fieldbackground="#ffffff",
-                            foreground="black",
-                            font=("Helvetica", 10))
-            style.configure("TNotebook", background="#ECF0F1")
-            style.configure("TNotebook.Tab", background="#4A90E2", foreground="black", font=("Helvetica", 10, "bold"))
-            style.map("TNotebook.Tab",
-                      background=[('selected', '#357ABD')],
-                      foreground=[('selected', 'black')])
-            self.log_text.config(bg="#ffffff", fg="black")
-        else:
-            self.master.configure(bg="#2C3E50")
-            style = ttk.Style()
-            style.configure("TButton",
-                            background="#4A90E2",
-                            foreground="black",
-                            font=("Helvetica", 10, "bold"))
-            style.map("TButton",
-                      background=[('active', '#357ABD')])
-            style.configure("TLabel",
-                            background="#2C3E50",
-                            foreground="black",
-                            font=("Helvetica", 10))
-            style.configure("TFrame",
-                            background="#2C3E50")
-            style.configure("TEntry",
-                            fieldbackground="#34495E",
-                            foreground="black",
-                            font=("Helvetica", 10))
-            style.configure("TCombobox",
-                            fieldbackground="#34495E",
-                            foreground="black",
-                            font=("Helvetica", 10))
-            style.configure("TNotebook", background="#2C3E50")
-            style.configure("TNotebook.Tab", background="#4A90E2", foreground="black", font=("Helvetica", 10, "bold"))
-            style.map("TNotebook.Tab",
-                      background=[('selected', '#357ABD')],
-                      foreground=[('selected', 'black')])
-            self.log_text.config(bg="#34495E", fg="black")
+        theme = "Light" if self.theme_var.get() == "Light" else "Dark"
+        if theme == self._current_theme:
+            return
+        self.master.configure(bg=self._themes[theme]["window_bg"])
+        self.apply_theme(theme)
+        self.log_text.config(bg=self._themes[theme]["log_bg"], fg="black")
+
+    def change_precision(self, event):
+        precision = self.precision_var.get()
+        try:
+            self.calculator.set_precision(precision)
+            self.log(f"Simulator precision set to {precision}.")
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {e}")
+            logging.error(f"Error in change_precision: {e}")
 
     def apply_settings(self):
         self.update_font_size()
@@ -570,12 +1031,7 @@ class QuantumVerseCalculatorGUI:
             shots = int(self.observe_shots_entry.get())
             if num_qubits <= 0 or shots <= 0:
                 raise ValueError
-            counts = self.calculator.observe_qubits(num_qubits, shots)
-            self.observe_result.config(state='normal')
-            self.observe_result.delete('1.0', tk.END)
-            self.observe_result.insert(tk.END, f"Measurement Results:\n{counts}")
-            self.observe_result.config(state='disabled')
-            self.log(f"Observed {num_qubits} qubits with {shots} shots.")
+            self.calculator.submit_observe(num_qubits, shots, self.callback_for(self.show_observe_result, num_qubits, shots))
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter positive integers for qubits and shots.")
         except ImportError as ie:
@@ -585,15 +1041,23 @@ class QuantumVerseCalculatorGUI:
             messagebox.showerror("Error", f"An error occurred: {e}")
             logging.error(f"Error in observe_qubits: {e}")
 
+    def show_observe_result(self, counts, num_qubits, shots):
+        self.observe_result.config(state='normal')
+        self.observe_result.delete('1.0', tk.END)
+        # Only the most frequent outcomes; the full dict is 2^n entries for large n
+        top = _top_counts(counts)
+        lines = '\n'.join(f"  |{outcome}⟩: {count}" for outcome, count in top)
+        self.observe_result.insert(tk.END, f"Measurement Results (top {len(top)} of {len(counts)}):\n{lines}\n")
+        self.observe_result.config(state='disabled')
+        self.log(f"Observed {num_qubits} qubits with {shots} shots.")
+
     def calculate_error_rate(self):
         try:
             num_qubits = int(self.error_qubits_entry.get())
             shots = int(self.error_shots_entry.get())
             if num_qubits <= 0 or shots <= 0:
                 raise ValueError
-            error_rate = self.calculator.calculate_error_rates(num_qubits, shots)
-            self.error_result.config(text=f"Error Rate: {error_rate:.4f}")
-            self.log(f"Calculated error rate for {num_qubits} qubits with {shots} shots: {error_rate:.4f}")
+            self.calculator.submit_error_rate(num_qubits, shots, self.callback_for(self.show_error_rate, num_qubits, shots))
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter positive integers for qubits and shots.")
         except ImportError as ie:
@@ -603,6 +1067,11 @@ class QuantumVerseCalculatorGUI:
             messagebox.showerror("Error", f"An error occurred: {e}")
             logging.error(f"Error in calculate_error_rates: {e}")
 
+    def show_error_rate(self, rates, num_qubits, shots):
+        error_rate, bit_error_rate = rates
+        self.error_result.config(text=f"Error Rate: {error_rate:.4f}\nBit Error Rate: {bit_error_rate:.4f}")
+        self.log(f"Calculated error rate for {num_qubits} qubits with {shots} shots: {error_rate:.4f} (bit error rate {bit_error_rate:.4f})")
+
     def apply_gate(self):
         try:
             gate_type = self.gate_type_var.get()
@@ -611,17 +1080,7 @@ class QuantumVerseCalculatorGUI:
             if qubit < 0:
                 raise ValueError
             circuit = self.calculator.calculate_gate_variables(gate_type, angle, qubit)
-            job = self.calculator.backend.run(circuit, shots=1024)
-            result = job.result()
-            statevector = result.get_statevector(circuit)
-            counts = result.get_counts(circuit)
-            self.gate_result.config(state='normal')
-            self.gate_result.delete('1.0', tk.END)
-            self.gate_result.insert(tk.END, f"Gate Applied: {gate_type} on Qubit {qubit}\n")
-            self.gate_result.insert(tk.END, f"Statevector:\n{statevector}\n")
-            self.gate_result.insert(tk.END, f"Measurement Results:\n{counts}")
-            self.gate_result.config(state='disabled')
-            self.log(f"Applied gate {gate_type} with angle {angle} on qubit {qubit}.")
+            self.calculator.submit_gate(circuit, self.callback_for(self.show_gate_result, gate_type, angle, qubit))
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter a valid qubit index and angle.")
         except ImportError as ie:
@@ -631,6 +1090,27 @@ class QuantumVerseCalculatorGUI:
             messagebox.showerror("Error", f"An error occurred: {e}")
             logging.error(f"Error in apply_gate: {e}")
 
+    def show_gate_result(self, output, gate_type, angle, qubit):
+        counts, statevector = output
+        self.gate_result.config(state='normal')
+        self.gate_result.delete('1.0', tk.END)
+        self.gate_result.insert(tk.END, f"Gate Applied: {gate_type} on Qubit {qubit}\n")
+        self.gate_result.insert(tk.END, f"Statevector:\n{self.format_statevector(statevector, qubit + 1)}\n")
+        self.gate_result.insert(tk.END, f"Measurement Results:\n{counts}")
+        self.gate_result.config(state='disabled')
+        self.log(f"Applied gate {gate_type} with angle {angle} on qubit {qubit}.")
+
+    @staticmethod
+    def format_statevector(statevector, num_qubits: int, top_k: int = 16) -> str:
+        """
+        Render only the top_k basis states by probability instead of the full 2^n repr.
+        """
+        sv = np.asarray(statevector)
+        probs = sv.real * sv.real + sv.imag * sv.imag
+        top = np.argpartition(-probs, min(top_k, len(probs) - 1))[:top_k]
+        order = top[np.argsort(-probs[top])]
+        return '\n'.join(f"|{i:0{num_qubits}b}⟩: {sv[i]:+.4f} (p={probs[i]:.4f})" for i in order)
+
     def calculate_spin(self):
         try:
             qubit_state = self.spin_state_var.get()
@@ -650,9 +1130,7 @@ class QuantumVerseCalculatorGUI:
             num_qubits = int(self.grover_qubits_entry.get())
             if num_qubits <= 0 or not all(bit in '01' for bit in target_state):
                 raise ValueError
-            speed = self.calculator.grovers_speed_between_qubits(target_state, num_qubits)
-            self.grover_result.config(text=f"Grover's Speed: {speed}")
-            self.log(f"Ran Grover's algorithm for target state '{target_state}' with {num_qubits} qubits.")
+            self.calculator.submit_grover(target_state, num_qubits, self.callback_for(self.show_grover_result, target_state, num_qubits))
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter a valid binary target state and positive number of qubits.")
         except ImportError as ie:
@@ -662,21 +1140,103 @@ class QuantumVerseCalculatorGUI:
             messagebox.showerror("Error", f"An error occurred: {e}")
             logging.error(f"Error in grovers_speed_between_qubits: {e}")
 
+    def show_grover_result(self, speed, target_state, num_qubits):
+        self.grover_result.config(text=f"Grover's Speed: {speed}")
+        self.log(f"Ran Grover's algorithm for target state '{target_state}' with {num_qubits} qubits.")
+
+    def run_sweep(self):
+        try:
+            gate_type = self.sweep_gate_var.get()
+            qubit = int(self.sweep_qubit_entry.get())
+            start = float(self.sweep_start_entry.get())
+            stop = float(self.sweep_stop_entry.get())
+            steps = int(self.sweep_steps_entry.get())
+            if qubit < 0 or steps <= 0:
+                raise ValueError
+            angles = np.linspace(start, stop, steps)
+            self.calculator.submit_sweep(gate_type, angles, qubit, self.callback_for(self.show_sweep_result, gate_type, qubit, angles))
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter a valid qubit index, angles, and a positive number of steps.")
+        except ImportError as ie:
+            messagebox.showerror("Import Error", str(ie))
+            logging.error(str(ie))
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {e}")
+            logging.error(f"Error in run_sweep: {e}")
+
+    def show_sweep_result(self, error_rates, gate_type, qubit, angles):
+        self.plot_sweep(gate_type, qubit, angles, error_rates)
+        self.log(f"Swept gate {gate_type} on qubit {qubit} over {len(angles)} angles from {angles[0]} to {angles[-1]}.")
+
+    def plot_sweep(self, gate_type: str, qubit: int, angles: np.ndarray, error_rates: np.ndarray):
+        if self.sweep_canvas is None:
+            try:
+                from matplotlib.figure import Figure
+                from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            except ImportError:
+                raise ImportError("Plotting requires matplotlib. Install it using 'pip install matplotlib'.")
+            self.sweep_figure = Figure(figsize=(7, 3), dpi=100)
+            self.sweep_axes = self.sweep_figure.add_subplot(111)
+            self.sweep_canvas = FigureCanvasTkAgg(self.sweep_figure, master=self.sweep_plot_frame)
+            self.sweep_canvas.get_tk_widget().pack(fill='both', expand=True)
+        self.sweep_axes.clear()
+        self.sweep_axes.plot(angles, error_rates)
+        self.sweep_axes.set_xlabel("Angle (rad)")
+        self.sweep_axes.set_ylabel("Error Rate")
+        self.sweep_axes.set_title(f"{gate_type} on Qubit {qubit}")
+        self.sweep_figure.tight_layout()
+        self.sweep_canvas.draw()
+
     def log(self, message: str):
         self.log_queue.put(message)
 
+    def callback_for(self, handler, *args):
+        """
+        Wrap a result handler so calculator jobs hand their result back to the Tk thread.
+        """
+        return lambda value, error: self.result_queue.put((handler, value, error, args))
+
+    def process_result_queue(self):
+        try:
+            while True:
+                handler, value, error, args = self.result_queue.get_nowait()
+                try:
+                    if error is not None:
+                        raise error
+                    handler(value, *args)
+                except ImportError as ie:
+                    messagebox.showerror("Import Error", str(ie))
+                    logging.error(str(ie))
+                except Exception as e:
+                    messagebox.showerror("Error", f"An error occurred: {e}")
+                    logging.error(f"Error in {handler.__name__}: {e}")
+        except queue.Empty:
+            pass
+        finally:
+            self.master.after(50, self.process_result_queue)
+
     def process_log_queue(self):
+        messages = []
+        try:
+            while True:
+                messages.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
         try:
-            while not self.log_queue.empty():
-                message = self.log_queue.get_nowait()
+            if messages:
+                self.log_idle_cycles = 0
                 self.log_text.config(state='normal')
-                self.log_text.insert(tk.END, f"{message}\n")
+                self.log_text.insert(tk.END, '\n'.join(messages) + '\n')
                 self.log_text.see(tk.END)
                 self.log_text.config(state='disabled')
+            else:
+                self.log_idle_cycles += 1
         except Exception as e:
             logging.error(f"Error processing log queue: {e}")
         finally:
-            self.master.after(100, self.process_log_queue)
+            # Poll less often once the log has been quiet for a while
+            delay = 250 if self.log_idle_cycles >= 10 else 100
+            self.master.after(delay, self.process_log_queue)
 
 # --- Main Execution ---
 def main():
@@ -685,6 +1245,7 @@ def main():
         root.configure(bg="#2C3E50")
         app = QuantumVerseCalculatorGUI(root)
         root.mainloop()
+        app.calculator.close()
     except Exception as e:
         error_trace = traceback.format_exc()
         logging.critical(f"Unexpected error:\n{error_trace}")